@@ -0,0 +1,260 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional
+
+COMPACT_FORMAT_VERSION = 1
+SECONDS_PER_DAY = 3600 * 24.
+
+
+def extract_compact_params(model, target: str, freq: str = 'D') -> Dict[str, Any]:
+    """
+    Extract the compact parameters of a fitted `LogTransformer() * Prophet` pipeline
+
+    Only the fitted MAP parameters of Prophet, the log-transform settings and the
+    cutoff are kept, so the result can be serialized to a small JSON document.
+    """
+    # sktime is only needed to extract the params, the compact predictor runs without it
+    from sktime.forecasting.fbprophet import Prophet
+    from sktime.transformations.series.boxcox import LogTransformer
+
+    if len(model.steps_) != 2:
+        raise ValueError(f"Compact model only supports a two step pipeline, got {len(model.steps_)} steps")
+    transformer = model.steps_[0][1]
+    forecaster = model.steps_[-1][1]
+    if not isinstance(transformer, LogTransformer):
+        raise ValueError(f"Compact model only supports LogTransformer, got {type(transformer).__name__}")
+    if not isinstance(forecaster, Prophet):
+        raise ValueError(f"Compact model only supports Prophet, got {type(forecaster).__name__}")
+    prophet = forecaster._forecaster
+
+    if prophet.growth != 'linear':
+        raise ValueError(f"Compact model only supports linear growth, got '{prophet.growth}'")
+    if prophet.mcmc_samples > 0:
+        raise ValueError("Compact model only supports MAP fitted Prophet models")
+    if prophet.holidays is not None or getattr(prophet, 'country_holidays', None) is not None:
+        raise ValueError("Compact model does not support holidays")
+    if prophet.extra_regressors:
+        raise ValueError("Compact model does not support extra regressors")
+
+    seasonalities = []
+    for name, props in prophet.seasonalities.items():
+        if props['condition_name'] is not None:
+            raise ValueError(f"Compact model does not support conditional seasonality '{name}'")
+        seasonalities.append({
+            'name': name,
+            'period': float(props['period']),
+            'fourier_order': int(props['fourier_order']),
+            'mode': props['mode'],
+        })
+
+    # Prophet >= 1.1.5 may scale y with min-max instead of abs-max
+    scaling = getattr(prophet, 'scaling', 'absmax')
+    floor = float(prophet.y_min) if scaling == 'minmax' else 0.0
+
+    cutoff = model.cutoff
+    if isinstance(cutoff, pd.Index):
+        cutoff = cutoff[-1]
+
+    params = prophet.params
+    return {
+        'format_version': COMPACT_FORMAT_VERSION,
+        'target': target,
+        'freq': freq,
+        'cutoff': pd.Timestamp(cutoff).isoformat(),
+        'log_transform': {
+            'offset': float(transformer.offset),
+            'scale': float(transformer.scale),
+        },
+        'prophet': {
+            'start': pd.Timestamp(prophet.start).isoformat(),
+            't_scale': pd.Timedelta(prophet.t_scale).total_seconds(),
+            'y_scale': float(prophet.y_scale),
+            'floor': floor,
+            'changepoints_t': np.asarray(prophet.changepoints_t, dtype=float).tolist(),
+            'k': float(np.ravel(params['k'])[0]),
+            'm': float(np.ravel(params['m'])[0]),
+            'delta': np.asarray(params['delta'][0], dtype=float).tolist(),
+            'beta': np.asarray(params['beta'][0], dtype=float).tolist(),
+            'sigma_obs': float(np.ravel(params['sigma_obs'])[0]),
+            'seasonalities': seasonalities,
+            # 0 means Prophet was fitted with intervals disabled
+            'uncertainty_samples': int(prophet.uncertainty_samples or 0),
+        },
+    }
+
+
+class CompactProphetForecaster:
+    """
+    Lightweight predictor rebuilding `LogTransformer() * Prophet` forecasts with NumPy
+
+    Prophet and Stan are not required: the trend, the seasonal components and the
+    simulated uncertainty intervals are computed from the compact parameters.
+    """
+
+    def __init__(self, compact: Dict[str, Any], random_state: Optional[int] = 0):
+        if compact.get('format_version') != COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact model version {compact.get('format_version')}")
+
+        self.compact = compact
+        self.random_state = random_state
+        self.target = compact['target']
+        self.freq = compact['freq']
+        self.cutoff = pd.Timestamp(compact['cutoff'])
+        self.offset = compact['log_transform']['offset']
+        self.scale = compact['log_transform']['scale']
+
+        prophet = compact['prophet']
+        self.start = pd.Timestamp(prophet['start'])
+        self.t_scale = prophet['t_scale']
+        self.y_scale = prophet['y_scale']
+        self.floor = prophet['floor']
+        self.changepoints_t = np.asarray(prophet['changepoints_t'], dtype=float)
+        self.k = prophet['k']
+        self.m = prophet['m']
+        self.delta = np.asarray(prophet['delta'], dtype=float)
+        self.beta = np.asarray(prophet['beta'], dtype=float)
+        self.sigma_obs = prophet['sigma_obs']
+        self.seasonalities = prophet['seasonalities']
+        self.uncertainty_samples = prophet['uncertainty_samples']
+
+    @classmethod
+    def load(cls, path: str, random_state: Optional[int] = 0) -> 'CompactProphetForecaster':
+        """
+        Load a compact model from a local JSON file
+        """
+        with open(path, 'r') as f:
+            return cls(json.load(f), random_state=random_state)
+
+    @classmethod
+    def from_mlflow(cls, artifact_uri: str, random_state: Optional[int] = 0) -> 'CompactProphetForecaster':
+        """
+        Load a compact model logged to MLFlow, e.g. 'runs:/<run_id>/compact_model/model.json'
+        """
+        import mlflow
+        return cls(mlflow.artifacts.load_dict(artifact_uri), random_state=random_state)
+
+    def save(self, path: str) -> None:
+        """
+        Save the compact model to a local JSON file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.compact, f)
+
+    def predict(self, fh) -> pd.Series:
+        """
+        Point forecast in the original scale of the target
+        """
+        dates = self._to_dates(fh)
+        trend, seasonal_a, seasonal_m = self._components(dates)
+        yhat = trend * (1 + seasonal_m) + seasonal_a
+        return pd.Series(self._inverse_transform(yhat), index=dates, name=self.target)
+
+    def predict_interval(self, fh, coverage: float = 0.9) -> pd.DataFrame:
+        """
+        Prediction intervals in the same column layout as sktime's `predict_interval`
+        """
+        if self.uncertainty_samples <= 0:
+            raise ValueError("Prediction intervals are unavailable, the model has uncertainty_samples=0")
+
+        dates = self._to_dates(fh)
+        coverages = coverage if isinstance(coverage, (list, tuple)) else [coverage]
+        samples = self._sample_posterior_predictive(dates)
+
+        columns = pd.MultiIndex.from_product([[self.target], coverages, ['lower', 'upper']])
+        pred_int = pd.DataFrame(index=dates, columns=columns, dtype=float)
+        for cov in coverages:
+            lower = np.nanpercentile(samples, 100 * (1 - cov) / 2, axis=1)
+            upper = np.nanpercentile(samples, 100 * (1 + cov) / 2, axis=1)
+            pred_int[(self.target, cov, 'lower')] = self._inverse_transform(lower)
+            pred_int[(self.target, cov, 'upper')] = self._inverse_transform(upper)
+
+        return pred_int
+
+    def _to_dates(self, fh) -> pd.DatetimeIndex:
+        """
+        Resolve a horizon into absolute dates, following sktime: integers are steps
+        of `freq` after the cutoff, datetimes are taken as they are
+        """
+        if hasattr(fh, 'to_absolute'):
+            cutoff = pd.DatetimeIndex([self.cutoff], freq=self.freq)
+            return pd.DatetimeIndex(fh.to_absolute(cutoff).to_pandas())
+
+        values = np.atleast_1d(np.asarray(fh))
+        inferred = pd.api.types.infer_dtype(values, skipna=False)
+        if inferred == 'integer':
+            offset = pd.tseries.frequencies.to_offset(self.freq)
+            return pd.DatetimeIndex([self.cutoff + int(step) * offset for step in values])
+        if inferred in ('datetime64', 'datetime', 'date'):
+            return pd.DatetimeIndex(values)
+
+        raise ValueError(f"Unsupported forecasting horizon of type '{inferred}'")
+
+    def _inverse_transform(self, values: np.ndarray) -> np.ndarray:
+        return (np.exp(values) - self.offset) / self.scale
+
+    def _time(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        return np.asarray((dates - self.start).total_seconds(), dtype=float) / self.t_scale
+
+    def _components(self, dates: pd.DatetimeIndex):
+        t = self._time(dates)
+        trend = self._piecewise_linear(t, self.delta, self.changepoints_t) * self.y_scale + self.floor
+        seasonal_a, seasonal_m = self._seasonal_terms(dates)
+        return trend, seasonal_a, seasonal_m
+
+    def _piecewise_linear(self, t: np.ndarray, deltas: np.ndarray, changepoints_t: np.ndarray) -> np.ndarray:
+        deltas_t = (changepoints_t[None, :] <= t[..., None]) * deltas
+        k_t = deltas_t.sum(axis=1) + self.k
+        m_t = (deltas_t * -changepoints_t).sum(axis=1) + self.m
+        return k_t * t + m_t
+
+    def _seasonal_terms(self, dates: pd.DatetimeIndex):
+        days = np.asarray((dates - pd.Timestamp('1970-01-01')).total_seconds(), dtype=float) / SECONDS_PER_DAY
+        seasonal_a = np.zeros(len(dates))
+        seasonal_m = np.zeros(len(dates))
+
+        col = 0
+        for seasonality in self.seasonalities:
+            order = seasonality['fourier_order']
+            features = np.empty((len(dates), 2 * order))
+            for i in range(order):
+                c = days * 2 * np.pi * (i + 1) / seasonality['period']
+                features[:, 2 * i] = np.sin(c)
+                features[:, 2 * i + 1] = np.cos(c)
+
+            component = features @ self.beta[col:col + 2 * order]
+            col += 2 * order
+
+            if seasonality['mode'] == 'multiplicative':
+                seasonal_m += component
+            else:
+                seasonal_a += component * self.y_scale
+
+        return seasonal_a, seasonal_m
+
+    def _sample_posterior_predictive(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Simulate forecasts the way Prophet does: new trend changepoints drawn from
+        the fitted changepoint rate plus Gaussian observation noise
+        """
+        rng = np.random.default_rng(self.random_state)
+        t = self._time(dates)
+        T = t.max()
+        lambda_ = np.mean(np.abs(self.delta)) + 1e-8
+        seasonal_a, seasonal_m = self._seasonal_terms(dates)
+
+        samples = np.empty((len(dates), self.uncertainty_samples))
+        for i in range(self.uncertainty_samples):
+            n_changes = rng.poisson(len(self.changepoints_t) * (T - 1)) if T > 1 else 0
+            changepoints_new = np.sort(1 + rng.random(n_changes) * (T - 1))
+            deltas_new = rng.laplace(0, lambda_, n_changes)
+
+            trend = self._piecewise_linear(
+                t,
+                np.concatenate((self.delta, deltas_new)),
+                np.concatenate((self.changepoints_t, changepoints_new))
+            ) * self.y_scale + self.floor
+            noise = rng.normal(0, self.sigma_obs, len(dates)) * self.y_scale
+            samples[:, i] = trend * (1 + seasonal_m) + seasonal_a + noise
+
+        return samples
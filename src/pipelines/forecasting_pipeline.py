@@ -4,6 +4,7 @@ import pandas as pd
 from ..dataops.data_loader import CSVDataLoader
 from ..dataops.data_preprocessor import DataPreprocessor
 from ..dataops.data_quality import DataQuality
+from ..models.compact_prophet import extract_compact_params
 # Forecasting
 from sktime.forecasting.fbprophet import Prophet
 from sktime.forecasting.base import ForecastingHorizon
@@ -84,6 +85,13 @@ class ForecastingPipeline:
                     logging.info(f'{vendor}: Logging their model to MLFlow')
                     mlflow_sktime.log_model(model, artifact_path="model", signature=signature)
 
+                    logging.info(f'{vendor}: Logging their compact model to MLFlow')
+                    try:
+                        compact = extract_compact_params(model, self.target, self.config['forecasting']['freq'])
+                        mlflow.log_dict(compact, "compact_model/model.json")
+                    except ValueError as e:
+                        logging.warning(f'{vendor}: Skipping compact model, {e}')
+
                     lower = pred_intervals.loc[:, ([self.target], [self.coverage], ['lower'])]
                     upper = pred_intervals.loc[:, ([self.target], [self.coverage], ['upper'])]
 
@@ -0,0 +1,100 @@
+import json
+import pytest
+
+pytest.importorskip("prophet")
+pytest.importorskip("sktime")
+
+import numpy as np
+import pandas as pd
+
+from sktime.forecasting.fbprophet import Prophet
+from sktime.forecasting.base import ForecastingHorizon
+from sktime.transformations.series.boxcox import BoxCoxTransformer, LogTransformer
+from sktime.transformations.series.exponent import ExponentTransformer
+from src.models.compact_prophet import extract_compact_params, CompactProphetForecaster
+
+TARGET = 'valorVenda'
+COVERAGE = 0.65
+HORIZON = 90
+# Same params as ForecastingPipeline
+PARAMS = {
+    'seasonality_mode': 'additive',
+    'yearly_seasonality': True,
+    'weekly_seasonality': True,
+    'daily_seasonality': False
+}
+
+
+@pytest.fixture(scope="module")
+def y():
+    """
+    Synthetic positive daily sales with trend, weekly and yearly seasonality
+    """
+    rng = np.random.default_rng(42)
+    index = pd.date_range('2021-01-01', periods=2 * 365, freq='D')
+    t = np.arange(len(index))
+    values = (
+        1000
+        + 0.8 * t
+        + 150 * np.sin(2 * np.pi * t / 7)
+        + 300 * np.sin(2 * np.pi * t / 365.25)
+        + rng.normal(0, 50, len(index))
+    )
+    return pd.Series(values, index=index, name=TARGET)
+
+
+@pytest.fixture(scope="module")
+def model(y):
+    model = LogTransformer() * Prophet(**PARAMS)
+    model.fit(y)
+    return model
+
+
+@pytest.fixture(scope="module")
+def fh(y):
+    return ForecastingHorizon(pd.date_range(y.index[-1], periods=HORIZON + 1, freq='D')[1:], is_relative=False)
+
+
+def _compact(model):
+    # Round trip through JSON, as the artifact is stored in MLFlow
+    return json.loads(json.dumps(extract_compact_params(model, TARGET)))
+
+
+def test_predict_matches_full_model(model, fh):
+    compact = CompactProphetForecaster(_compact(model))
+    y_pred = model.predict(fh)
+
+    for horizon in (fh, np.arange(1, HORIZON + 1), list(range(1, HORIZON + 1)), fh.to_relative(model.cutoff)):
+        compact_pred = compact.predict(horizon)
+        assert compact_pred.index.equals(pd.DatetimeIndex(y_pred.index))
+        np.testing.assert_allclose(compact_pred.values, y_pred.values, rtol=1e-6)
+
+
+def test_predict_interval_matches_full_model(model, fh):
+    compact = CompactProphetForecaster(_compact(model))
+    pred_int = model.predict_interval(fh, coverage=COVERAGE)
+    compact_int = compact.predict_interval(fh, coverage=COVERAGE)
+
+    for bound in ('lower', 'upper'):
+        column = (TARGET, COVERAGE, bound)
+        np.testing.assert_allclose(compact_int[column].values, pred_int[column].values, rtol=0.1)
+
+
+def test_predict_interval_without_uncertainty_samples(model, fh):
+    compact = _compact(model)
+    compact['prophet']['uncertainty_samples'] = 0
+
+    with pytest.raises(ValueError):
+        CompactProphetForecaster(compact).predict_interval(fh, coverage=COVERAGE)
+
+
+@pytest.mark.parametrize("pipeline", [
+    lambda: LogTransformer() * ExponentTransformer() * Prophet(**PARAMS),
+    lambda: BoxCoxTransformer() * Prophet(**PARAMS),
+])
+def test_unsupported_pipeline_raises(y, pipeline):
+    model = pipeline()
+    model.fit(y)
+
+    with pytest.raises(ValueError):
+        extract_compact_params(model, TARGET)